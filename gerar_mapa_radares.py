@@ -11,19 +11,110 @@ Curso: Ciência de Dados (PT-BR) — material didático.
 """
 
 import argparse
+import base64
+import csv
+import glob
+import gzip
 import json
 import re
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import folium
-from folium.plugins import HeatMap, MiniMap
+from folium.plugins import MiniMap
+
+try:  # opcional: serializador JSON bem mais rápido (e que aceita arrays NumPy direto)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Enquadramento do Sudeste (SP, MG, RJ, ES): usado para filtrar pontos e para o fit_bounds do mapa
+LAT_MIN, LAT_MAX = -25.8, -14.0
+LON_MIN, LON_MAX = -53.6, -39.0
+UFS_SUDESTE = ["SP", "MG", "RJ", "ES"]
+
+# Versão da limpeza dos CSVs: entra no nome do cache .parquet; incremente ao mudar limpar_acidentes/limpar_radares
+VERSAO_LIMPEZA = 1
+
+# Heatmap renderizado na GPU (WebGL) em vez do Leaflet.heat (canvas 2D, ponto a ponto).
+# A camada (L.webGLHeatmap) fica no repositório, ao lado deste script, e é embutida no HTML:
+# nenhum JS de terceiros além do que o folium já carrega.
+HEATMAP_WEBGL_JS = Path(__file__).with_name("heatmap_webgl.js")
+
+
+# Potências de 10 exatas em float64 (até 1e22), usadas pelo parser compilado
+POTENCIAS_10 = np.array([10.0**k for k in range(23)])
+
+# Funções marcadas com @jit_opcional; o Numba (opcional) só é importado quando o parser linha a linha é usado
+# em pelo menos MIN_LINHAS_NUMBA linhas: import + carga do kernel custam ~0,3 s, e o float() do Python
+# faz ~1,5 µs/linha contra ~0,6 µs/linha compilado (empata perto de 200–300 mil linhas)
+MIN_LINHAS_NUMBA = 200_000
+_COMPILAVEIS = []
+_numba_ok = None
 
 
 # -----------------------------
 # 1) Funções utilitárias
 # -----------------------------
+def jit_opcional(func):
+    """
+    Marca a função para ser compilada com Numba (nopython, cache em disco) por carregar_numba();
+    até lá (ou sem Numba instalado) vale a própria função Python.
+    """
+    _COMPILAVEIS.append(func.__name__)
+    return func
+
+
+def carregar_numba() -> bool:
+    """
+    Importa o Numba sob demanda (o import custa ~0,35 s e a maioria das execuções nem chega ao
+    parser linha a linha) e troca as funções marcadas pelas versões compiladas.
+    Retorna False se o Numba não estiver instalado.
+    """
+    global _numba_ok
+    if _numba_ok is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _numba_ok = False
+        else:
+            for nome in _COMPILAVEIS:
+                globals()[nome] = njit(cache=True)(globals()[nome])
+            _numba_ok = True
+    return _numba_ok
+
+
+def json_compacto(obj) -> str:
+    """
+    JSON sem espaços para embutir no HTML. Usa orjson se estiver instalado;
+    senão, json da biblioteca padrão (arrays/escalares NumPy viram listas/números via .tolist()).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=lambda o: o.tolist())
+
+
+def ler_csv_colunas(caminho: Path, colunas: list, tipos: dict = None) -> pd.DataFrame:
+    """
+    Lê só as colunas necessárias de um CSV (UTF-8) com o leitor multithread do PyArrow.
+    Os nomes do cabeçalho são normalizados (strip + minúsculas) antes da seleção;
+    colunas da lista que não existirem no arquivo são simplesmente ignoradas.
+    """
+    with open(caminho, encoding="utf-8-sig", newline="") as f:  # -sig: ignora o BOM do "CSV UTF-8" do Excel
+        nomes = [c.strip().lower() for c in next(csv.reader(f))]
+    incluir = [c for c in colunas if c in nomes]
+    tipos = {c: t for c, t in (tipos or {}).items() if c in incluir}
+    tbl = pacsv.read_csv(
+        caminho,
+        read_options=pacsv.ReadOptions(column_names=nomes, skip_rows=1, use_threads=True),
+        convert_options=pacsv.ConvertOptions(include_columns=incluir, column_types=tipos, strings_can_be_null=True),
+    )
+    return tbl.to_pandas()
+
+
 def normalizar_coord(valor: object) -> float:
     """
     Converte strings numéricas com vírgula decimal/sep. de milhares para float.
@@ -44,17 +135,313 @@ def normalizar_coord(valor: object) -> float:
         return np.nan
 
 
-def aggregate_for_heatmap(df: pd.DataFrame, weight_col: str, decimals: int = 3) -> pd.DataFrame:
+def normalizar_coord_series(s: pd.Series) -> pd.Series:
+    """
+    Versão vetorizada de normalizar_coord: aplica as mesmas regras na coluna inteira
+    (operações de string do pandas), sem chamar uma função Python por linha.
+    Colunas já numéricas são apenas convertidas para float.
+    """
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype("float64")
+    s2 = s.astype("string").str.strip().str.replace(",", ".", regex=False)
+    # remove ponto de milhares: 1.234.567,89 -> 1234567.89
+    s2 = s2.str.replace(r"(?<=\d)\.(?=\d{3}(?:\D|$))", "", regex=True)
+    # se ainda restou mais de um ponto, mantém apenas o primeiro
+    partes = s2.str.partition(".")
+    sem_extras = partes[0] + partes[1] + partes[2].str.replace(".", "", regex=False)
+    s2 = s2.where(s2.str.count(r"\.").le(1), sem_extras)
+    out = pd.to_numeric(s2, errors="coerce").astype("float64")
+    # O que o caminho vetorizado não leu (formatos bagunçados) vai para o parser linha a linha, só nessas linhas
+    falhou = out.isna() & s2.notna() & s2.ne("")
+    if falhou.any():
+        out[falhou] = normalizar_coord_linhas(s[falhou])
+    return out
+
+
+def normalizar_coord_linhas(s: pd.Series) -> np.ndarray:
+    """
+    Caminho linha a linha: com muitas linhas (>= MIN_LINHAS_NUMBA), textos ASCII vão para o parser
+    compilado (Numba), se disponível; o que ele não resolve (NaN), o resto e tudo, com poucas linhas
+    ou sem Numba, passa por normalizar_coord.
+    """
+    txt = s.astype("string").str.strip()
+    out = np.full(len(txt), np.nan)
+    if len(txt) >= MIN_LINHAS_NUMBA and carregar_numba():
+        eh_ascii = txt.str.fullmatch(r"[\x00-\x7f]*").fillna(False).to_numpy(dtype=bool)
+    else:
+        eh_ascii = np.zeros(len(txt), dtype=bool)
+    if eh_ascii.any():
+        out[eh_ascii] = parse_coord_array(txt[eh_ascii].str.encode("ascii").to_numpy())
+    resto = np.isnan(out)
+    if resto.any():
+        out[resto] = [normalizar_coord(v) for v in s.to_numpy()[resto]]
+    return out
+
+
+@jit_opcional
+def eh_digito(c) -> bool:
+    return 48 <= c <= 57
+
+
+@jit_opcional
+def eh_espaco(c) -> bool:
+    # mesmos espaços ASCII que str.strip()/float() ignoram
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+
+@jit_opcional
+def eh_separador_milhar(buf, i, fim) -> bool:
+    """
+    Ponto/vírgula em buf[i] precedido de dígito e seguido de exatamente 3 dígitos
+    (mesma regra do regex de normalizar_coord).
+    """
+    if i == 0 or not eh_digito(buf[i - 1]) or i + 3 >= fim:
+        return False
+    if not (eh_digito(buf[i + 1]) and eh_digito(buf[i + 2]) and eh_digito(buf[i + 3])):
+        return False
+    return i + 4 == fim or not eh_digito(buf[i + 4])
+
+
+@jit_opcional
+def parse_coord(buf, ini, fim, tmp) -> float:
+    """
+    Lê o número em buf[ini:fim] (bytes ASCII) sem regex, com as regras de normalizar_coord.
+    1ª passada (em tmp): ',' vale '.', ponto seguido de exatamente 3 dígitos é separador de milhar
+    e, dos que sobram, só o primeiro fica. 2ª passada: mesma gramática do float() do Python
+    (sinal, '_' entre dígitos, expoente). Só devolve o valor quando ele sai com um único
+    arredondamento (até 15 dígitos significativos e 10**±22), igual ao float(); nos demais casos,
+    e se não for um número, retorna NaN (quem chama repassa essas linhas a normalizar_coord).
+    """
+    n = 0
+    ponto = False
+    for i in range(ini, fim):
+        c = int(buf[i])
+        if c == 46 or c == 44:  # '.' / ','
+            if eh_separador_milhar(buf, i, fim) or ponto:
+                continue
+            ponto = True
+            c = 46
+        tmp[n] = c
+        n += 1
+
+    i = 0
+    while i < n and eh_espaco(tmp[i]):
+        i += 1
+    while n > i and eh_espaco(tmp[n - 1]):
+        n -= 1
+
+    sinal = 1.0
+    if i < n and (tmp[i] == 45 or tmp[i] == 43):  # '-' / '+'
+        if tmp[i] == 45:
+            sinal = -1.0
+        i += 1
+
+    mant = 0  # até 18 dígitos significativos (cabe em int64)
+    sig = 0
+    exp10 = 0
+    digitos = 0
+    ponto = False
+    while i < n:
+        c = int(tmp[i])
+        if eh_digito(c):
+            digitos += 1
+            if sig < 18:
+                if mant > 0 or c != 48:
+                    sig += 1
+                mant = mant * 10 + (c - 48)
+                if ponto:
+                    exp10 -= 1
+            elif not ponto:
+                exp10 += 1
+        elif c == 46 and not ponto:
+            ponto = True
+        elif c == 95 and 0 < i < n - 1 and eh_digito(tmp[i - 1]) and eh_digito(tmp[i + 1]):  # '_'
+            pass
+        else:
+            break
+        i += 1
+    if digitos == 0:
+        return np.nan
+
+    if i < n and (tmp[i] == 101 or tmp[i] == 69):  # 'e' / 'E'
+        i += 1
+        sinal_exp = 1
+        if i < n and (tmp[i] == 45 or tmp[i] == 43):
+            if tmp[i] == 45:
+                sinal_exp = -1
+            i += 1
+        exp_val = 0
+        digitos_exp = 0
+        while i < n:
+            c = int(tmp[i])
+            if eh_digito(c):
+                digitos_exp += 1
+                if exp_val < 100000:
+                    exp_val = exp_val * 10 + (c - 48)
+            elif not (c == 95 and eh_digito(tmp[i - 1]) and i + 1 < n and eh_digito(tmp[i + 1])):
+                break
+            i += 1
+        if digitos_exp == 0:
+            return np.nan
+        exp10 += sinal_exp * exp_val
+    if i != n:
+        return np.nan
+
+    if mant == 0:
+        return sinal * 0.0
+    if sig > 15 or exp10 > 22 or exp10 < -22:
+        return np.nan  # mant ou 10**exp10 não seriam exatos em float64: fica para o float() do Python
+    # mant e 10**exp10 exatos em float64 -> uma única operação, arredondada corretamente
+    valor = float(mant)
+    if exp10 > 0:
+        valor *= POTENCIAS_10[exp10]
+    elif exp10 < 0:
+        valor /= POTENCIAS_10[-exp10]
+    return sinal * valor
+
+
+@jit_opcional
+def parse_coord_lote(buf, offsets):
+    n = len(offsets) - 1
+    maior = 0
+    for k in range(n):
+        maior = max(maior, offsets[k + 1] - offsets[k])
+    tmp = np.empty(maior, dtype=np.uint8)
+    out = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        out[k] = parse_coord(buf[offsets[k] : offsets[k + 1]], 0, offsets[k + 1] - offsets[k], tmp)
+    return out
+
+
+def parse_coord_array(valores: np.ndarray) -> np.ndarray:
+    """
+    Aplica parse_coord a um array de bytes (um texto por linha): junta tudo num único buffer
+    uint8 + offsets e roda o laço compilado.
+    """
+    tamanhos = np.fromiter((len(v) for v in valores), dtype=np.int64, count=len(valores))
+    offsets = np.zeros(len(valores) + 1, dtype=np.int64)
+    np.cumsum(tamanhos, out=offsets[1:])
+    buf = np.frombuffer(b"".join(valores), dtype=np.uint8)
+    return parse_coord_lote(buf, offsets)
+
+
+def aggregate_for_heatmap_multi(
+    df: pd.DataFrame, weight_cols: tuple = ("feridos", "mortos"), decimals: int = 3
+) -> dict:
     """
     Agrega pontos em 'grades' espaciais (arredondando lat/lon) para acelerar o heatmap.
     - decimals=3 ~ ~110 m (aprox); ajuste se quiser mais/menos suavização.
+    - As células viram chaves inteiras (int32), sem copiar o DataFrame original.
+    - Um único groupby soma todas as colunas de peso; retorna {coluna: DataFrame(uf, lat, lon, weight)}.
+    """
+    weight_cols = list(weight_cols)
+    scale = 10**decimals
+    lat_i = np.rint(df["latitude"].to_numpy(dtype=np.float64) * scale).astype(np.int32)
+    lon_i = np.rint(df["longitude"].to_numpy(dtype=np.float64) * scale).astype(np.int32)
+    # .array mantém o Categorical (to_numpy() voltaria a strings): o groupby usa os códigos da UF
+    d = pd.DataFrame({"uf": df["uf"].astype("category").array, "lat_i": lat_i, "lon_i": lon_i})
+    for w in weight_cols:
+        d[w] = df[w].to_numpy()
+    g = d.groupby(["uf", "lat_i", "lon_i"], sort=False, observed=True, as_index=False)[weight_cols].sum()
+    g["lat"] = g["lat_i"] / scale
+    g["lon"] = g["lon_i"] / scale
+    g = g.drop(columns=["lat_i", "lon_i"])
+
+    out = {}
+    for w in weight_cols:
+        sub = g[["uf", "lat", "lon", w]].rename(columns={w: "weight"})
+        out[w] = sub[sub["weight"] > 0].reset_index(drop=True)
+    return out
+
+
+def formatar_numero(s: pd.Series) -> pd.Series:
     """
-    d = df.copy()
-    d["lat_bin"] = d["latitude"].round(decimals)
-    d["lon_bin"] = d["longitude"].round(decimals)
-    g = d.groupby(["uf", "lat_bin", "lon_bin"], as_index=False)[weight_col].sum()
-    g.rename(columns={"lat_bin": "lat", "lon_bin": "lon", weight_col: "weight"}, inplace=True)
-    return g[g["weight"] > 0]
+    Texto de uma coluna numérica como o JS mostraria (96.0 -> '96', 45.93 -> '45.93');
+    faltantes viram ''.
+    """
+    txt = s.astype("string").str.replace(r"\.0$", "", regex=True)
+    return txt.fillna("")
+
+
+def montar_popups(df: pd.DataFrame) -> pd.Series:
+    """
+    HTML do popup de cada radar, montado de uma vez (coluna inteira) em vez de no navegador.
+    """
+    return (
+        '<div style="font-size:12px;"><b>Radar proposto</b><br/>UF: '
+        + df["uf"].astype("string")
+        + "<br/>Eficácia: "
+        + formatar_numero(df["prob_alta_eficacia"])
+        + "<br/>Prioridade: "
+        + formatar_numero(df["indice_prioridade_norm"])
+        + "<br/>BR-"
+        + formatar_numero(df["br"])
+        + "<br/>KM: "
+        + formatar_numero(df["trecho_km_final"])
+        + "<br/>ID: "
+        + df["id_trecho"].astype("string").fillna("")
+        + "</div>"
+    )
+
+
+def quantizar(s: pd.Series, escala: float, dtype) -> np.ndarray:
+    """
+    Arredonda s * escala para inteiros (dtype) — números bem mais curtos no JSON.
+    O JS recupera o valor com q / escala.
+    """
+    return np.rint(s.to_numpy(dtype=np.float64) * escala).astype(dtype)
+
+
+def indices_ordenados_por_uf(df: pd.DataFrame, ufs) -> dict:
+    """
+    Para cada UF, devolve as posições dos radares ordenadas por eficácia e por prioridade,
+    mais tabelas 'limiar inteiro (0..100) -> primeira posição válida' (busca binária pronta).
+    Permite ao JS pular direto para os pontos acima do slider, sem varrer todos.
+    """
+    uf_arr = df["uf"].to_numpy()
+    limiares = np.arange(101)
+    out = {}
+    for uf in ufs:
+        pos = np.flatnonzero(uf_arr == uf)
+        if not len(pos):
+            continue
+        entry = {}
+        for col, chave in [("prob_alta_eficacia", "ef"), ("indice_prioridade_norm", "pr")]:
+            vals = df[col].to_numpy(dtype=np.float64)[pos]
+            ordem = np.argsort(vals, kind="stable")
+            entry[f"idx_by_{chave}"] = pos[ordem]
+            entry[f"{chave}_start"] = np.searchsorted(vals[ordem], limiares, side="left")
+        out[uf] = entry
+    return out
+
+
+def percentis_por_uf(df: pd.DataFrame, col: str, ufs) -> dict:
+    """
+    Tabela de percentis 0..100 da coluna por UF, com a mesma regra do JS
+    (valor ordenado na posição round(p/100 * (n-1))) — o filtro 'Top %' vira uma consulta O(1).
+    """
+    uf_arr = df["uf"].to_numpy()
+    p = np.arange(101)
+    out = {}
+    for uf in ufs:
+        vals = np.sort(df[col].to_numpy(dtype=np.float64)[uf_arr == uf])
+        if not len(vals):
+            continue
+        idx = np.floor((p / 100) * (len(vals) - 1) + 0.5).astype(np.int64)
+        out[uf] = vals[idx]
+    return out
+
+
+def filtrar_sudeste(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normaliza a UF (maiúsculas, sem espaços), mantém só as linhas do Sudeste e converte
+    a coluna para categórica com as 4 UFs (o filtro vem antes: UF fora das categorias não vira NaN).
+    """
+    uf = df["uf"].str.upper().str.strip()
+    manter = uf.isin(UFS_SUDESTE).to_numpy()
+    df = df.loc[manter].copy()
+    df["uf"] = pd.Categorical(uf.to_numpy()[manter], categories=UFS_SUDESTE)
+    return df
 
 
 def ensure_columns(df: pd.DataFrame, cols: list) -> pd.DataFrame:
@@ -71,33 +458,75 @@ def ensure_columns(df: pd.DataFrame, cols: list) -> pd.DataFrame:
 # -----------------------------
 # 2) Pipeline principal
 # -----------------------------
-def gerar_html_mapa(
-    csv_acidentes: Path,
-    csv_radares: Path,
-    arquivo_saida: Path,
-):
-    ufs_sudeste = {"SP", "MG", "RJ", "ES"}
-
-    # ----- Ler acidentes
-    df_acc = pd.read_csv(csv_acidentes, encoding="utf-8")
-    df_acc.columns = [c.strip().lower() for c in df_acc.columns]
-    # normaliza UF e filtra Sudeste
-    df_acc["uf"] = df_acc["uf"].astype(str).str.upper().str.strip()
-    df_acc = df_acc[df_acc["uf"].isin(ufs_sudeste)].copy()
+def load_clean(csv_path: Path, cleaner_fn, key: str, forcar: bool = False) -> pd.DataFrame:
+    """
+    Devolve o DataFrame limpo de um CSV, usando um cache Parquet (zstd) ao lado dele.
+    O nome do cache leva a versão da limpeza, o tamanho e o mtime (ns) do CSV:
+    <csv>.clean.<key>.v<VERSAO_LIMPEZA>.<tamanho>.<mtime_ns>.parquet só é reaproveitado se existir
+    exatamente com esses valores; senão roda cleaner_fn(csv_path), regrava o cache e apaga os caches
+    antigos desse CSV. forcar=True ignora o cache existente.
+    """
+    info = csv_path.stat()
+    cache = csv_path.with_suffix(f".clean.{key}.v{VERSAO_LIMPEZA}.{info.st_size}.{info.st_mtime_ns}.parquet")
+    if not forcar and cache.exists():
+        return pd.read_parquet(cache, engine="pyarrow")
+    df = cleaner_fn(csv_path)
+    try:
+        # grava num temporário e renomeia: uma execução interrompida não deixa um cache pela metade
+        tmp = cache.with_name(cache.name + ".tmp")
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+        tmp.replace(cache)
+        for antigo in csv_path.parent.glob(f"{glob.escape(csv_path.stem)}.clean.{key}.*parquet"):
+            if antigo != cache:
+                antigo.unlink(missing_ok=True)
+    except OSError as e:  # sem permissão de escrita etc.: segue sem cache
+        print(f"[AVISO] Não foi possível atualizar o cache {cache}: {e}")
+    return df
+
+
+def limpar_acidentes(csv_path: Path) -> pd.DataFrame:
+    """
+    Lê o CSV de acidentes e deixa só pontos do Sudeste com coordenadas válidas.
+    """
+    df_acc = ler_csv_colunas(
+        csv_path,
+        ["uf", "latitude", "longitude", "feridos", "mortos"],
+        {"uf": pa.string(), "feridos": pa.float64(), "mortos": pa.float64()},
+    )
+    # pesos lidos como float (aceita "1.0", "1.5" e vazios); viram int32 quando são todos inteiros
+    for col in ["feridos", "mortos"]:
+        v = df_acc[col].to_numpy()
+        if np.isfinite(v).all() and (v == np.rint(v)).all() and (np.abs(v) < 2**31).all():
+            df_acc[col] = v.astype(np.int32)
+    # normaliza UF e filtra Sudeste (UF vira categórica com só as 4 UFs)
+    df_acc = filtrar_sudeste(df_acc)
     # coordenadas já devem estar limpas, mas reforçamos:
-    df_acc["latitude"] = df_acc["latitude"].apply(normalizar_coord)
-    df_acc["longitude"] = df_acc["longitude"].apply(normalizar_coord)
-    df_acc = df_acc.dropna(subset=["latitude", "longitude"])
+    df_acc["latitude"] = normalizar_coord_series(df_acc["latitude"])
+    df_acc["longitude"] = normalizar_coord_series(df_acc["longitude"])
+    # descarta coordenadas inválidas e pontos fora do enquadramento antes de agregar (between é False p/ NaN)
+    mask = df_acc["latitude"].between(LAT_MIN, LAT_MAX) & df_acc["longitude"].between(LON_MIN, LON_MAX)
+    df_acc = df_acc.loc[mask]
 
-    # [Opcional] reforçar filtro de BR se quiser
+    # [Opcional] reforçar filtro de BR se quiser (inclua "br" nas colunas lidas acima)
     # br_permitidas = {40,50,101,116,135,146,153,251,259,262,267,354,356,364,365,381,393,447,452,459,460,465,474,488,493,495,601}
     # if "br" in df_acc.columns:
     #     df_acc["br"] = pd.to_numeric(df_acc["br"], errors="coerce")
     #     df_acc = df_acc[df_acc["br"].isin(br_permitidas)].copy()
+    return df_acc
+
 
-    # ----- Ler radares
-    df_rad = pd.read_csv(csv_radares, encoding="utf-8")
-    df_rad.columns = [c.strip().lower() for c in df_rad.columns]
+def limpar_radares(csv_path: Path) -> pd.DataFrame:
+    """
+    Lê o CSV de radares propostos: UF do Sudeste, coordenadas/índices numéricos e extras do popup.
+    """
+    df_rad = ler_csv_colunas(
+        csv_path,
+        [
+            "uf", "latitude", "longitude", "trecho_latitude_central", "trecho_longitude_central",
+            "prob_alta_eficacia", "indice_prioridade_norm", "br", "trecho_km_final", "id_trecho",
+        ],
+        {"uf": pa.string(), "id_trecho": pa.string()},
+    )
 
     # Detecta nomes de latitude/longitude (trecho_* ou direto)
     if "trecho_latitude_central" in df_rad.columns and "trecho_longitude_central" in df_rad.columns:
@@ -111,64 +540,122 @@ def gerar_html_mapa(
     df_rad = ensure_columns(df_rad, ["br", "trecho_km_final", "id_trecho"])
 
     # Normaliza UF e filtra Sudeste
-    df_rad["uf"] = df_rad["uf"].astype(str).str.upper().str.strip()
-    df_rad = df_rad[df_rad["uf"].isin(ufs_sudeste)].copy()
+    df_rad = filtrar_sudeste(df_rad)
 
     # Limpeza de coordenadas/índices
-    df_rad["latitude"] = df_rad["latitude"].apply(normalizar_coord)
-    df_rad["longitude"] = df_rad["longitude"].apply(normalizar_coord)
+    df_rad["latitude"] = normalizar_coord_series(df_rad["latitude"])
+    df_rad["longitude"] = normalizar_coord_series(df_rad["longitude"])
     for col in ["prob_alta_eficacia", "indice_prioridade_norm"]:
         df_rad[col] = pd.to_numeric(df_rad[col], errors="coerce")
     # Extras p/ popup
     if "br" in df_rad.columns:
-        df_rad["br"] = pd.to_numeric(df_rad["br"], errors="coerce")
+        # número da rodovia é inteiro: Int64 (nullable) guarda faltantes como <NA>, sem float/NaN nem "116.0"
+        df_rad["br"] = pd.to_numeric(df_rad["br"], errors="coerce").round().astype("Int64")
     if "trecho_km_final" in df_rad.columns:
         df_rad["trecho_km_final"] = pd.to_numeric(df_rad["trecho_km_final"], errors="coerce")
     if "id_trecho" in df_rad.columns:
-        df_rad["id_trecho"] = df_rad["id_trecho"].astype(str)
-
-    # Remove linhas inválidas
-    df_rad = df_rad.dropna(subset=["latitude", "longitude", "prob_alta_eficacia", "indice_prioridade_norm"])
+        df_rad["id_trecho"] = df_rad["id_trecho"].astype("string")
+
+    # Remove linhas inválidas (sem coordenada/índice ou fora do enquadramento) com uma única máscara
+    mask = (
+        df_rad["latitude"].notna()
+        & df_rad["longitude"].notna()
+        & df_rad["prob_alta_eficacia"].notna()
+        & df_rad["indice_prioridade_norm"].notna()
+        & df_rad["latitude"].between(LAT_MIN, LAT_MAX)
+        & df_rad["longitude"].between(LON_MIN, LON_MAX)
+    )
+    df_rad = df_rad.loc[mask].reset_index(drop=True)
     df_rad["prob_alta_eficacia"] = df_rad["prob_alta_eficacia"].clip(0, 100)
     df_rad["indice_prioridade_norm"] = df_rad["indice_prioridade_norm"].clip(0, 100)
+    return df_rad
+
+
+def gerar_html_mapa(
+    csv_acidentes: Path,
+    csv_radares: Path,
+    arquivo_saida: Path,
+    gzip_junto: bool = False,
+    forcar_limpeza: bool = False,
+):
+    # ----- Ler e limpar acidentes/radares (com cache Parquet ao lado de cada CSV)
+    df_acc = load_clean(csv_acidentes, limpar_acidentes, "acidentes", forcar=forcar_limpeza)
+    df_rad = load_clean(csv_radares, limpar_radares, "radares", forcar=forcar_limpeza)
 
     # ----- Agregações para heatmap
-    agg_feridos = aggregate_for_heatmap(df_acc, "feridos", decimals=3)
-    agg_mortos = aggregate_for_heatmap(df_acc, "mortos", decimals=3)
+    aggs = aggregate_for_heatmap_multi(df_acc, ("feridos", "mortos"), decimals=3)
+    agg_feridos, agg_mortos = aggs["feridos"], aggs["mortos"]
 
     # ----- Cria o mapa centrado no Sudeste (bounds fixos)
-    lat_min, lat_max = -25.8, -14.0
-    lon_min, lon_max = -53.6, -39.0
-    center_lat = (lat_min + lat_max) / 2
-    center_lon = (lon_min + lon_max) / 2
+    center_lat = (LAT_MIN + LAT_MAX) / 2
+    center_lon = (LON_MIN + LON_MAX) / 2
 
     m = folium.Map(location=[center_lat, center_lon], zoom_start=6, tiles="CartoDB positron", control_scale=True)
-    m.fit_bounds([[lat_min, lon_min], [lat_max, lon_max]])
+    m.fit_bounds([[LAT_MIN, LON_MIN], [LAT_MAX, LON_MAX]])
     MiniMap(toggle_display=True).add_to(m)
+    # Script do heatmap WebGL no <body> (o Leaflet já foi carregado no <head>)
+    m.get_root().html.add_child(
+        folium.Element(f"<script>{HEATMAP_WEBGL_JS.read_text(encoding='utf-8')}</script>")
+    )
 
     # ----- Funções auxiliares de camadas
-    def add_heat_layers_by_uf(map_obj, df_agg, label_prefix, radius=12, blur=15, max_zoom=10):
+    def add_webgl_heat(map_obj, fg, pts, radius):
+        """
+        Heatmap WebGL dentro do FeatureGroup `fg` (o LayerControl continua ligando/desligando o grupo).
+        Pontos [lat, lon, peso] vão em JSON num <div> escondido; o JS cria a camada quando o grupo existir.
+        O peso que satura a cor é o percentil 99 da camada (poucas células extremas não apagam o resto).
+        """
+        peso_max = max(float(np.percentile(pts[:, 2], 99)), 1.0) if len(pts) else 1.0
+        fg_var_name = fg.get_name()
+        data_id = "heat_" + fg_var_name
+        pts_json = json_compacto(pts)
+        map_obj.get_root().html.add_child(
+            folium.Element(f'<div id="{data_id}" style="display:none;">{pts_json}</div>')
+        )
+        js = f"""
+(function() {{
+  var tentativas = 0;
+  function waitReady() {{
+    var fg = window['{fg_var_name}'];
+    if (!fg || !L.webGLHeatmap) {{
+      // ~12 s sem o grupo ou a camada: desiste e avisa em vez de ficar tentando para sempre
+      if (++tentativas > 200) {{ return console.error('Heatmap WebGL indisponível ({data_id})'); }}
+      return setTimeout(waitReady, 60);
+    }}
+    var pts = JSON.parse(document.getElementById('{data_id}').textContent || '[]');
+    var heat = L.webGLHeatmap({{size: {2 * radius}, opacity: 0.8, max: {peso_max:.6g}}});
+    // os dados só são entregues quando a camada entra no mapa (grupos ocultos não desenham nada)
+    heat.on('add', function() {{ heat.setData(pts); }});
+    fg.addLayer(heat);
+  }}
+  waitReady();
+}})();
+"""
+        map_obj.get_root().script.add_child(folium.Element(js))
+
+    def add_heat_layers_by_uf(map_obj, df_agg, label_prefix, radius=12):
         """
         Cria 4 camadas (SP, MG, ES, RJ) com heatmap somando os pesos por célula agregada.
         """
+        grupos = dict(list(df_agg.groupby("uf", sort=False, observed=True)))
         for uf in ["SP", "MG", "ES", "RJ"]:
-            sub = df_agg[df_agg["uf"] == uf]
-            if sub.empty:
+            sub = grupos.get(uf)
+            if sub is None or sub.empty:
                 continue
-            pts = sub[["lat", "lon", "weight"]].values.tolist()
+            pts = np.ascontiguousarray(sub[["lat", "lon", "weight"]].to_numpy(dtype=np.float64))
             fg = folium.FeatureGroup(name=f"{label_prefix} - {uf}", show=False)
-            HeatMap(pts, radius=radius, blur=blur, max_zoom=max_zoom).add_to(fg)
             fg.add_to(map_obj)
+            add_webgl_heat(map_obj, fg, pts, radius)
 
-    def add_combined_layer(map_obj, df_agg, layer_name, radius=12, blur=15, max_zoom=10):
+    def add_combined_layer(map_obj, df_agg, layer_name, radius=12):
         """
         Camada combinada (todos os estados) para uma métrica (Feridos/Mortos).
         """
         sub = df_agg.groupby(["lat", "lon"], as_index=False)["weight"].sum()
-        pts = sub[["lat", "lon", "weight"]].values.tolist()
+        pts = np.ascontiguousarray(sub[["lat", "lon", "weight"]].to_numpy(dtype=np.float64))
         fg = folium.FeatureGroup(name=layer_name, show=True)  # visível por padrão
-        HeatMap(pts, radius=radius, blur=blur, max_zoom=max_zoom).add_to(fg)
         fg.add_to(map_obj)
+        add_webgl_heat(map_obj, fg, pts, radius)
 
     # ----- Adiciona camadas
     add_heat_layers_by_uf(m, agg_feridos, "Feridos")
@@ -180,12 +667,25 @@ def gerar_html_mapa(
     fg_radares = folium.FeatureGroup(name="Radares Propostos", show=True)
     fg_radares.add_to(m)
 
-    cols_popup = ["latitude", "longitude", "uf", "prob_alta_eficacia", "indice_prioridade_norm", "br", "trecho_km_final", "id_trecho"]
-    radar_records = df_rad[cols_popup].to_dict(orient="records")
-    radar_json = json.dumps(radar_records, ensure_ascii=False)
-    # Técnica segura: dados em <div> escondido, e JS puro injetado no final:
-    json_div = '<div id="radar-data" style="display:none;">' + radar_json + "</div>"
-    m.get_root().html.add_child(folium.Element(json_div))
+    # Popups prontos (BR, KM e ID só aparecem neles, então não vão como colunas separadas)
+    df_rad["popup"] = montar_popups(df_rad)
+    # Formato colunar (uma lista por coluna)
+    # (a UF de cada radar não vai como coluna: o filtro por UF usa as listas de by_uf)
+    payload = {"n": len(df_rad), "popup": df_rad["popup"].tolist()}
+    # Números quantizados em inteiros: coordenadas em 1e-5 grau (~1 m), índices em centésimos (0..10000)
+    payload["lat_q"] = quantizar(df_rad["latitude"], 1e5, np.int32)
+    payload["lon_q"] = quantizar(df_rad["longitude"], 1e5, np.int32)
+    for col, chave in [("prob_alta_eficacia", "ef_q"), ("indice_prioridade_norm", "prio_q")]:
+        q = quantizar(df_rad[col], 100, np.int16)
+        payload[chave] = q
+        df_rad[col] = q / 100  # filtros/índices abaixo usam exatamente o valor que o JS vai ver
+    payload["by_uf"] = indices_ordenados_por_uf(df_rad, sorted(UFS_SUDESTE))
+    payload["percentiles"] = percentis_por_uf(df_rad, "indice_prioridade_norm", sorted(UFS_SUDESTE))
+    radar_json = json_compacto(payload)
+    # Técnica segura: dados comprimidos (gzip + base64) num <script> inerte, e JS puro injetado no final:
+    radar_b64 = base64.b64encode(gzip.compress(radar_json.encode("utf-8"), compresslevel=6)).decode("ascii")
+    data_tag = '<script id="radar-data" type="application/gzip+base64">' + radar_b64 + "</script>"
+    m.get_root().html.add_child(folium.Element(data_tag))
 
     # ----- JS de UI + marcadores (sem <script>, para evitar conflitos de template)
     map_var_name = m.get_name()
@@ -195,8 +695,32 @@ def gerar_html_mapa(
 (function() {{
   var MAP_VAR_NAME = '{map_var_name}';
   var FG_VAR_NAME  = '{fg_var_name}';
-  var radarData = JSON.parse(document.getElementById('radar-data').textContent || '[]');
-  var markers = [];
+  var D = {{n: 0}};
+  var markers = [];                 // cache: índice do radar -> L.circleMarker (criado uma única vez)
+  var currentlyVisible = new Set(); // índices hoje presentes na camada
+  var markerMode = null;            // 'ef' | 'pr' usado nas cores atuais dos marcadores
+
+  function loadRadarData() {{
+    // base64 -> bytes -> gunzip (nativo do navegador) -> JSON
+    var b64 = (document.getElementById('radar-data').textContent || '').trim();
+    if (!b64) return Promise.resolve({{n: 0}});
+    var bin = Uint8Array.from(atob(b64), function(c) {{ return c.charCodeAt(0); }});
+    var stream = new Blob([bin]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return new Response(stream).json();
+  }}
+
+  function decodeRadarData(d) {{
+    // inteiros quantizados (Python) -> floats: lat/lon em 1e-5 grau, eficácia/prioridade em centésimos
+    d.lat = new Float64Array(d.n); d.lon = new Float64Array(d.n);
+    d.ef  = new Float64Array(d.n); d.pr  = new Float64Array(d.n);
+    for (var i=0;i<d.n;i++) {{
+      d.lat[i] = d.lat_q[i] / 1e5;
+      d.lon[i] = d.lon_q[i] / 1e5;
+      d.ef[i]  = d.ef_q[i] / 100;
+      d.pr[i]  = d.prio_q[i] / 100;
+    }}
+    return d;
+  }}
 
   function colorBlueToRed(v) {{
     // 0 -> azul, 100 -> vermelho
@@ -213,29 +737,106 @@ def gerar_html_mapa(
     return ufs;
   }}
 
-  function clearMarkers(layer) {{
-    markers.forEach(function(mk) {{ layer.removeLayer(mk); }});
-    markers = [];
+  function markerColor(i, mode) {{
+    var metric = (mode === 'ef') ? D.ef[i] : D.pr[i];
+    return colorBlueToRed(metric);
+  }}
+
+  function getMarker(i) {{
+    if (!markers[i]) {{
+      var color = markerColor(i, markerMode);
+      markers[i] = L.circleMarker([D.lat[i], D.lon[i]], {{
+        radius: 6,
+        color: color,
+        fillColor: color,
+        fillOpacity: 0.85,
+        weight: 1
+      }}).bindPopup(D.popup[i]);
+    }}
+    return markers[i];
+  }}
+
+  function updateVisible(layer, visiveis, mode) {{
+    // Recolore os marcadores já criados só quando o modo (ef <-> pr) muda
+    if (mode !== 'off' && mode !== markerMode) {{
+      markerMode = mode;
+      markers.forEach(function(mk, i) {{
+        var color = markerColor(i, mode);
+        mk.setStyle({{color: color, fillColor: color}});
+      }});
+    }}
+    // Diferença simétrica: só entra/sai da camada quem mudou de estado
+    var next = new Set(visiveis);
+    currentlyVisible.forEach(function(i) {{
+      if (!next.has(i)) layer.removeLayer(markers[i]);
+    }});
+    next.forEach(function(i) {{
+      if (!currentlyVisible.has(i)) layer.addLayer(getMarker(i));
+    }});
+    currentlyVisible = next;
   }}
 
-  function percentile(arr, p) {{
-    if (!arr.length) return 0;
-    var sorted = arr.slice().sort(function(a,b) {{ return a-b; }});
+  function percentileSorted(sorted, p) {{
+    if (!sorted.length) return 0;
     var idx = Math.min(sorted.length-1, Math.max(0, Math.round((p/100) * (sorted.length-1))));
     return sorted[idx];
   }}
 
+  var mergedCache = {{key: null, sorted: []}};  // prioridades ordenadas da última combinação de UFs
+
   function computePriorityCutoff(ufSel, mode, value) {{
     // 'min': corte fixo; 'top': pega percentil com base nas UFs selecionadas (top X% -> percentil 100-X)
     if (mode === 'min') return value;
-    var vals = radarData.filter(function(pt) {{ return ufSel.indexOf(pt.uf) !== -1; }})
-                        .map(function(pt) {{ return pt.indice_prioridade_norm; }});
     var perc = 100 - Math.max(0, Math.min(100, value));
-    return percentile(vals, perc);
+    if (ufSel.length === 1) {{
+      // uma UF: tabela de percentis pré-calculada no Python
+      var tab = D.percentiles[ufSel[0]];
+      return tab ? tab[perc] : 0;
+    }}
+    // várias UFs: junta os valores (já ordenados por UF) uma vez por combinação e reaproveita
+    var key = ufSel.slice().sort().join(',');
+    if (mergedCache.key !== key) {{
+      var vals = [];
+      ufSel.forEach(function(uf) {{
+        var B = D.by_uf[uf];
+        if (B) B.idx_by_pr.forEach(function(i) {{ vals.push(D.pr[i]); }});
+      }});
+      mergedCache = {{key: key, sorted: vals.sort(function(a,b) {{ return a-b; }})}};
+    }}
+    return percentileSorted(mergedCache.sorted, perc);
+  }}
+
+  function lowerBound(idx, vals, cutoff) {{
+    // primeira posição k de idx (ordenado por vals) com vals[idx[k]] >= cutoff
+    var lo = 0, hi = idx.length;
+    while (lo < hi) {{
+      var mid = (lo + hi) >> 1;
+      if (vals[idx[mid]] < cutoff) lo = mid + 1; else hi = mid;
+    }}
+    return lo;
+  }}
+
+  function visibleIndices(ufSel, probMin, prioMode, prioVal, prioCutoff) {{
+    // Para cada UF: pula (busca binária) tudo abaixo dos limiares e percorre só a menor das duas listas
+    var out = [];
+    var ef = D.ef, pr = D.pr;
+    ufSel.forEach(function(uf) {{
+      var B = D.by_uf[uf];
+      if (!B) return;
+      var startEf = B.ef_start[Math.max(0, Math.min(100, probMin))];
+      var startPr = (prioMode === 'min') ? B.pr_start[Math.max(0, Math.min(100, prioVal))]
+                                         : lowerBound(B.idx_by_pr, pr, prioCutoff);
+      var k, i;
+      if (B.idx_by_ef.length - startEf <= B.idx_by_pr.length - startPr) {{
+        for (k=startEf; k<B.idx_by_ef.length; k++) {{ i = B.idx_by_ef[k]; if (pr[i] >= prioCutoff) out.push(i); }}
+      }} else {{
+        for (k=startPr; k<B.idx_by_pr.length; k++) {{ i = B.idx_by_pr[k]; if (ef[i] >= probMin) out.push(i); }}
+      }}
+    }});
+    return out;
   }}
 
   function renderMarkers(mapObj, layer) {{
-    clearMarkers(layer);
     var ufSel   = getUFsSelecionadas();
 
     var probMin = parseInt(document.getElementById('probSlider').value, 10) || 0;  // eficácia mínima (slice)
@@ -259,51 +860,19 @@ def gerar_html_mapa(
     for (var i=0;i<modeEls.length;i++) {{ if (modeEls[i].checked) mode = modeEls[i].value; }}
 
     if (mode === 'off') {{
+      updateVisible(layer, [], mode);
       document.getElementById('radarCount').textContent = 0;
       return;
     }}
 
     var prioCutoff = computePriorityCutoff(ufSel, prioMode, prioVal);
 
-    var visibleCount = 0;
-    radarData.forEach(function(pt) {{
-      if (ufSel.indexOf(pt.uf) === -1) return;
-      if (pt.prob_alta_eficacia < probMin) return;                  // eficácia ≥ slider
-      if (pt.indice_prioridade_norm < prioCutoff) return;           // prioridade ≥ corte (ou top%)
-
-      visibleCount += 1;
-      var metric = (mode === 'ef') ? pt.prob_alta_eficacia : pt.indice_prioridade_norm;
-      var color = colorBlueToRed(metric);
-
-      var brTxt = (pt.br === null || pt.br === undefined || String(pt.br) === 'nan') ? '' : String(pt.br);
-      var kmTxt = (pt.trecho_km_final === null || pt.trecho_km_final === undefined) ? '' : String(pt.trecho_km_final);
-      var idTxt = (pt.id_trecho === null || pt.id_trecho === undefined || String(pt.id_trecho) === 'nan') ? '' : String(pt.id_trecho);
-
-      var html = ''
-        + '<div style="font-size:12px;">'
-        + '<b>Radar proposto</b><br/>'
-        + 'UF: ' + pt.uf + '<br/>'
-        + 'Eficácia: ' + pt.prob_alta_eficacia + '<br/>'
-        + 'Prioridade: ' + pt.indice_prioridade_norm + '<br/>'
-        + 'BR-' + brTxt + '<br/>'
-        + 'KM: ' + kmTxt + '<br/>'
-        + 'ID: ' + idTxt
-        + '</div>';
-
-      var marker = L.circleMarker([pt.latitude, pt.longitude], {{
-        radius: 6,
-        color: color,
-        fillColor: color,
-        fillOpacity: 0.85,
-        weight: 1
-      }}).bindPopup(html);
-
-      marker.addTo(layer);
-      markers.push(marker);
-    }});
+    // eficácia ≥ slider e prioridade ≥ corte (ou top%), só nas UFs marcadas
+    var visiveis = visibleIndices(ufSel, probMin, prioMode, prioVal, prioCutoff);
+    updateVisible(layer, visiveis, mode);
 
     // Atualiza contador de radares visíveis
-    document.getElementById('radarCount').textContent = visibleCount;
+    document.getElementById('radarCount').textContent = visiveis.length;
   }}
 
   function setupUI(mapObj, layer) {{
@@ -358,12 +927,23 @@ def gerar_html_mapa(
     }};
     control.addTo(mapObj);
 
+    // Agrupa vários eventos (ex.: arrastar o slider) em no máximo uma renderização por frame
+    var rafPending = false;
+    function schedule() {{
+      if (rafPending) return;
+      rafPending = true;
+      requestAnimationFrame(function() {{
+        rafPending = false;
+        renderMarkers(mapObj, layer);
+      }});
+    }}
+
     // Eventos
     document.addEventListener('input', function(e) {{
       if (!e.target) return;
       var id = e.target.id;
       if (id === 'probSlider' || id === 'prioValueMin' || id === 'prioValueTop' || e.target.classList.contains('ufChk') || e.target.name === 'radarMode' || e.target.name === 'prioMode') {{
-        renderMarkers(mapObj, layer);
+        schedule();
       }}
     }});
     document.addEventListener('click', function(e) {{
@@ -374,7 +954,7 @@ def gerar_html_mapa(
         document.getElementById('prioValueMin').value = 0;
         document.getElementById('prioValueTop').value = 20;
         document.querySelector('input[name="radarMode"][value="ef"]').checked = true;
-        renderMarkers(mapObj, layer);
+        schedule();
       }}
     }});
 
@@ -389,20 +969,32 @@ def gerar_html_mapa(
     if (!mapObj || !layer) {{ return setTimeout(waitReady, 60); }}
     setupUI(mapObj, layer);
   }}
-  waitReady();
+  loadRadarData().then(function(data) {{
+    D = decodeRadarData(data);
+    waitReady();
+  }}).catch(function(err) {{
+    console.error('Falha ao carregar dados dos radares:', err);
+  }});
 }})();
 """
     m.get_root().script.add_child(folium.Element(js_code))
 
-    # Controle de camadas
-    for key in list(m._children.keys()):
-        if "layer_control" in key:
-            del m._children[key]
+    # Controle de camadas (folium.Map não cria um sozinho; só garante que não haja outro antes de adicionar)
+    for key in [k for k, v in m._children.items() if isinstance(v, folium.LayerControl)]:
+        del m._children[key]
     folium.LayerControl(collapsed=False).add_to(m)
 
-    # Salva HTML
-    m.save(str(arquivo_saida))
+    # Salva HTML: renderiza tudo em memória e grava de uma vez (um write grande em vez de muitos pequenos)
+    dados_html = m.get_root().render().encode("utf-8")
+    with open(arquivo_saida, "wb", buffering=1024 * 1024) as f:
+        f.write(dados_html)
     print(f"[OK] HTML gerado em: {arquivo_saida.resolve()}")
+    if gzip_junto:
+        # cópia .html.gz para servidores que entregam o arquivo já comprimido (Content-Encoding: gzip)
+        arquivo_gz = arquivo_saida.with_name(arquivo_saida.name + ".gz")
+        with gzip.open(arquivo_gz, "wb", compresslevel=6) as f:
+            f.write(dados_html)
+        print(f"[OK] Versão gzip gerada em: {arquivo_gz.resolve()}")
 
 
 # -----------------------------
@@ -413,9 +1005,11 @@ def parse_args():
     p.add_argument("--acidentes", required=True, type=Path, help="Caminho do CSV de acidentes (pré-processado)")
     p.add_argument("--radares", required=True, type=Path, help="Caminho do CSV de radares propostos")
     p.add_argument("--saida", default=Path("heatmap_acidentes_sudeste_com_radares.html"), type=Path, help="Arquivo HTML de saída")
+    p.add_argument("--gzip", action="store_true", help="Também grava uma cópia comprimida (<saida>.gz)")
+    p.add_argument("--force-reclean", action="store_true", help="Ignora o cache .parquet e refaz a limpeza dos CSVs")
     return p.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    gerar_html_mapa(args.acidentes, args.radares, args.saida)
+    gerar_html_mapa(args.acidentes, args.radares, args.saida, gzip_junto=args.gzip, forcar_limpeza=args.force_reclean)
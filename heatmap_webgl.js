@@ -0,0 +1,331 @@
+// Heatmap em WebGL para Leaflet 1.x, sem outras dependências (o gerar_mapa_radares.py embute este arquivo no HTML).
+// Uso: L.webGLHeatmap({size: 24, opacity: 0.8, max: 50}).setData([[lat, lon, peso], ...])
+// 1ª passada: cada ponto vira um disco esfumaçado (gl.POINTS) acumulado por cima dos outros (source-over,
+//             como no Leaflet.heat) numa textura de intensidade; a projeção é feita na GPU (vertex shader).
+// 2ª passada: a intensidade é colorida pelo gradiente e desenhada no canvas da camada.
+(function () {
+  'use strict';
+
+  var VERT_PONTOS = [
+    'attribute vec2 a_pos;',          // pixels no zoom 0, relativos ao 1º ponto (cabe bem em float32)
+    'attribute float a_peso;',
+    'uniform vec2 u_origem;',         // posição do 1º ponto no canvas (px) no zoom atual
+    'uniform float u_escala;',        // 2^zoom
+    'uniform vec2 u_tela;',           // tamanho do canvas (px)
+    'uniform float u_tamanho;',       // diâmetro de cada ponto (px)
+    'uniform float u_peso_max;',
+    'uniform float u_min_opacidade;',
+    'varying float v_alfa;',
+    'void main() {',
+    '  vec2 p = u_origem + a_pos * u_escala;',
+    '  gl_Position = vec4(p.x / u_tela.x * 2.0 - 1.0, 1.0 - p.y / u_tela.y * 2.0, 0.0, 1.0);',
+    '  gl_PointSize = u_tamanho;',
+    '  v_alfa = clamp(max(a_peso / u_peso_max, u_min_opacidade), 0.0, 1.0);',
+    '}'
+  ].join('\n');
+
+  var FRAG_PONTOS = [
+    'precision mediump float;',
+    'varying float v_alfa;',
+    'void main() {',
+    '  vec2 c = gl_PointCoord * 2.0 - 1.0;',
+    '  float d = dot(c, c);',
+    '  if (d > 1.0) { discard; }',
+    '  float k = 1.0 - d;',
+    '  gl_FragColor = vec4(0.0, 0.0, 0.0, v_alfa * k * k);',
+    '}'
+  ].join('\n');
+
+  var VERT_TELA = [
+    'attribute vec2 a_canto;',
+    'varying vec2 v_uv;',
+    'void main() {',
+    '  v_uv = a_canto * 0.5 + 0.5;',
+    '  gl_Position = vec4(a_canto, 0.0, 1.0);',
+    '}'
+  ].join('\n');
+
+  var FRAG_TELA = [
+    'precision mediump float;',
+    'uniform sampler2D u_intensidade;',
+    'uniform sampler2D u_gradiente;',
+    'varying vec2 v_uv;',
+    'void main() {',
+    '  float a = texture2D(u_intensidade, v_uv).a;',
+    '  vec3 cor = texture2D(u_gradiente, vec2(a, 0.5)).rgb;',
+    '  gl_FragColor = vec4(cor * a, a);',  // alfa pré-multiplicado (padrão do contexto WebGL)
+    '}'
+  ].join('\n');
+
+  function compilar(gl, tipo, fonte) {
+    var sh = gl.createShader(tipo);
+    gl.shaderSource(sh, fonte);
+    gl.compileShader(sh);
+    if (!gl.getShaderParameter(sh, gl.COMPILE_STATUS)) {
+      throw new Error('shader: ' + gl.getShaderInfoLog(sh));
+    }
+    return sh;
+  }
+
+  function programa(gl, vert, frag) {
+    var p = gl.createProgram();
+    gl.attachShader(p, compilar(gl, gl.VERTEX_SHADER, vert));
+    gl.attachShader(p, compilar(gl, gl.FRAGMENT_SHADER, frag));
+    gl.linkProgram(p);
+    if (!gl.getProgramParameter(p, gl.LINK_STATUS)) {
+      throw new Error('programa: ' + gl.getProgramInfoLog(p));
+    }
+    return p;
+  }
+
+  function textura(gl, filtro) {
+    var t = gl.createTexture();
+    gl.bindTexture(gl.TEXTURE_2D, t);
+    gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, filtro);
+    gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MAG_FILTER, filtro);
+    gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE);
+    gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE);
+    return t;
+  }
+
+  function texturaGradiente(gl, grad) {
+    // mesma paleta do Leaflet.heat: gradiente linear de 256 px num canvas 2D
+    var c = document.createElement('canvas');
+    c.width = 256;
+    c.height = 1;
+    var ctx = c.getContext('2d');
+    var lin = ctx.createLinearGradient(0, 0, 256, 0);
+    for (var pos in grad) {
+      lin.addColorStop(+pos, grad[pos]);
+    }
+    ctx.fillStyle = lin;
+    ctx.fillRect(0, 0, 256, 1);
+    var t = textura(gl, gl.LINEAR);
+    gl.pixelStorei(gl.UNPACK_PREMULTIPLY_ALPHA_WEBGL, false);
+    gl.texImage2D(gl.TEXTURE_2D, 0, gl.RGBA, gl.RGBA, gl.UNSIGNED_BYTE, c);
+    return t;
+  }
+
+  L.WebGLHeatmap = L.Layer.extend({
+    options: {
+      size: 30,           // diâmetro de cada ponto (px)
+      opacity: 0.8,
+      max: 1.0,           // peso que sozinho já satura um ponto
+      minOpacity: 0.05,
+      gradient: {0.4: 'blue', 0.6: 'cyan', 0.7: 'lime', 0.8: 'yellow', 1.0: 'red'}
+    },
+
+    initialize: function (options) {
+      L.setOptions(this, options);
+      this._pontos = [];
+    },
+
+    setData: function (pontos) {
+      this._pontos = pontos || [];
+      this._enviados = false;  // reprojeta e reenvia para a GPU no próximo desenho
+      if (this._map) {
+        this._desenhar();
+      }
+      return this;
+    },
+
+    onAdd: function (map) {
+      var animado = map.options.zoomAnimation && L.Browser.any3d;
+      var canvas = this._canvas = L.DomUtil.create('canvas', 'leaflet-layer leaflet-zoom-' + (animado ? 'animated' : 'hide'));
+      canvas.style.opacity = this.options.opacity;
+      canvas.style.pointerEvents = 'none';
+      var self = this;
+      canvas.addEventListener('webglcontextlost', function (e) {
+        e.preventDefault();
+        self._gl = null;
+      });
+      canvas.addEventListener('webglcontextrestored', function () {
+        self._iniciarGL();
+        self._desenhar();
+      });
+      this.getPane().appendChild(canvas);
+      this._iniciarGL();
+      this._reset();
+    },
+
+    onRemove: function () {
+      this._liberarGL();
+      L.DomUtil.remove(this._canvas);
+      this._canvas = null;
+    },
+
+    getEvents: function () {
+      var ev = {moveend: this._reset, viewreset: this._reset, resize: this._reset};
+      if (this._map.options.zoomAnimation && L.Browser.any3d) {
+        ev.zoomanim = this._animarZoom;
+      }
+      return ev;
+    },
+
+    _iniciarGL: function () {
+      var opcoes = {premultipliedAlpha: true, antialias: false, depth: false, stencil: false};
+      var gl = this._canvas.getContext('webgl', opcoes) || this._canvas.getContext('experimental-webgl', opcoes);
+      this._gl = null;
+      if (!gl) {
+        console.error('Heatmap WebGL: o navegador não oferece WebGL');
+        return;
+      }
+      try {
+        this._progPontos = programa(gl, VERT_PONTOS, FRAG_PONTOS);
+        this._progTela = programa(gl, VERT_TELA, FRAG_TELA);
+      } catch (err) {
+        console.error('Heatmap WebGL:', err.message);
+        return;
+      }
+      this._bufPontos = gl.createBuffer();
+      this._bufTela = gl.createBuffer();
+      gl.bindBuffer(gl.ARRAY_BUFFER, this._bufTela);
+      gl.bufferData(gl.ARRAY_BUFFER, new Float32Array([-1, -1, 1, -1, -1, 1, 1, 1]), gl.STATIC_DRAW);
+      this._texGradiente = texturaGradiente(gl, this.options.gradient);
+      this._tamanhoMax = gl.getParameter(gl.ALIASED_POINT_SIZE_RANGE)[1];
+      this._alvo = null;
+      this._enviados = false;
+      this._gl = gl;
+    },
+
+    _liberarGL: function () {
+      var gl = this._gl;
+      if (!gl) {
+        return;
+      }
+      var perda = gl.getExtension('WEBGL_lose_context');  // devolve o contexto já (o navegador tem um limite deles)
+      this._gl = null;
+      if (perda) {
+        perda.loseContext();
+      }
+    },
+
+    _reset: function () {
+      var map = this._map;
+      var tam = map.getSize();
+      L.DomUtil.setPosition(this._canvas, map.containerPointToLayerPoint([0, 0]));
+      if (this._canvas.width !== tam.x || this._canvas.height !== tam.y) {
+        this._canvas.width = tam.x;
+        this._canvas.height = tam.y;
+      }
+      this._desenhar();
+    },
+
+    _animarZoom: function (e) {
+      var escala = this._map.getZoomScale(e.zoom);
+      var desloc = this._map._getCenterOffset(e.center)._multiplyBy(-escala).subtract(this._map._getMapPanePos());
+      L.DomUtil.setTransform(this._canvas, desloc, escala);
+    },
+
+    _enviarPontos: function () {
+      // projeta uma vez (zoom 0) e guarda [x, y, peso] relativos ao 1º ponto; o zoom atual é aplicado no shader
+      var gl = this._gl;
+      var pts = this._pontos;
+      var n = pts.length;
+      var dados = new Float32Array(n * 3);
+      var base = n ? this._map.project(L.latLng(pts[0][0], pts[0][1]), 0) : L.point(0, 0);
+      for (var i = 0; i < n; i++) {
+        var p = this._map.project(L.latLng(pts[i][0], pts[i][1]), 0);
+        dados[3 * i] = p.x - base.x;
+        dados[3 * i + 1] = p.y - base.y;
+        dados[3 * i + 2] = pts[i].length > 2 ? +pts[i][2] : 1;
+      }
+      gl.bindBuffer(gl.ARRAY_BUFFER, this._bufPontos);
+      gl.bufferData(gl.ARRAY_BUFFER, dados, gl.STATIC_DRAW);
+      this._base = base;
+      this._n = n;
+      this._enviados = true;
+    },
+
+    _garantirAlvo: function (w, h) {
+      // textura de intensidade (RGBA8, como o canvas do Leaflet.heat) + framebuffer, refeitos se o tamanho mudar
+      var gl = this._gl;
+      if (this._alvo && this._alvo.w === w && this._alvo.h === h) {
+        return;
+      }
+      if (this._alvo) {
+        gl.deleteFramebuffer(this._alvo.fbo);
+        gl.deleteTexture(this._alvo.tex);
+      }
+      var tex = textura(gl, gl.NEAREST);
+      gl.texImage2D(gl.TEXTURE_2D, 0, gl.RGBA, w, h, 0, gl.RGBA, gl.UNSIGNED_BYTE, null);
+      var fbo = gl.createFramebuffer();
+      gl.bindFramebuffer(gl.FRAMEBUFFER, fbo);
+      gl.framebufferTexture2D(gl.FRAMEBUFFER, gl.COLOR_ATTACHMENT0, gl.TEXTURE_2D, tex, 0);
+      this._alvo = {w: w, h: h, tex: tex, fbo: fbo};
+    },
+
+    _desenhar: function () {
+      var gl = this._gl;
+      if (!gl || !this._canvas) {
+        return;
+      }
+      var map = this._map;
+      var w = this._canvas.width;
+      var h = this._canvas.height;
+      if (!w || !h) {
+        return;
+      }
+      if (!this._enviados) {
+        this._enviarPontos();
+      }
+      this._garantirAlvo(w, h);
+      gl.viewport(0, 0, w, h);
+      gl.clearColor(0, 0, 0, 0);
+
+      // 1ª passada: intensidade
+      gl.bindFramebuffer(gl.FRAMEBUFFER, this._alvo.fbo);
+      gl.clear(gl.COLOR_BUFFER_BIT);
+      if (this._n) {
+        var p = this._progPontos;
+        var escala = map.getZoomScale(map.getZoom(), 0);
+        var origem = this._base.multiplyBy(escala).subtract(map.getPixelOrigin())
+          .subtract(map.containerPointToLayerPoint([0, 0]));
+        gl.useProgram(p);
+        gl.uniform2f(gl.getUniformLocation(p, 'u_origem'), origem.x, origem.y);
+        gl.uniform1f(gl.getUniformLocation(p, 'u_escala'), escala);
+        gl.uniform2f(gl.getUniformLocation(p, 'u_tela'), w, h);
+        gl.uniform1f(gl.getUniformLocation(p, 'u_tamanho'), Math.min(this.options.size, this._tamanhoMax));
+        gl.uniform1f(gl.getUniformLocation(p, 'u_peso_max'), this.options.max);
+        gl.uniform1f(gl.getUniformLocation(p, 'u_min_opacidade'), this.options.minOpacity);
+        var aPos = gl.getAttribLocation(p, 'a_pos');
+        var aPeso = gl.getAttribLocation(p, 'a_peso');
+        gl.bindBuffer(gl.ARRAY_BUFFER, this._bufPontos);
+        gl.enableVertexAttribArray(aPos);
+        gl.vertexAttribPointer(aPos, 2, gl.FLOAT, false, 12, 0);
+        gl.enableVertexAttribArray(aPeso);
+        gl.vertexAttribPointer(aPeso, 1, gl.FLOAT, false, 12, 8);
+        gl.enable(gl.BLEND);
+        gl.blendFunc(gl.ONE, gl.ONE_MINUS_SRC_ALPHA);
+        gl.drawArrays(gl.POINTS, 0, this._n);
+        gl.disable(gl.BLEND);
+        gl.disableVertexAttribArray(aPos);
+        gl.disableVertexAttribArray(aPeso);
+      }
+
+      // 2ª passada: cores no canvas
+      gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+      gl.clear(gl.COLOR_BUFFER_BIT);
+      var t = this._progTela;
+      gl.useProgram(t);
+      gl.activeTexture(gl.TEXTURE0);
+      gl.bindTexture(gl.TEXTURE_2D, this._alvo.tex);
+      gl.uniform1i(gl.getUniformLocation(t, 'u_intensidade'), 0);
+      gl.activeTexture(gl.TEXTURE1);
+      gl.bindTexture(gl.TEXTURE_2D, this._texGradiente);
+      gl.uniform1i(gl.getUniformLocation(t, 'u_gradiente'), 1);
+      var aCanto = gl.getAttribLocation(t, 'a_canto');
+      gl.bindBuffer(gl.ARRAY_BUFFER, this._bufTela);
+      gl.enableVertexAttribArray(aCanto);
+      gl.vertexAttribPointer(aCanto, 2, gl.FLOAT, false, 0, 0);
+      gl.drawArrays(gl.TRIANGLE_STRIP, 0, 4);
+      gl.disableVertexAttribArray(aCanto);
+      gl.activeTexture(gl.TEXTURE0);
+      gl.bindTexture(gl.TEXTURE_2D, null);  // a textura de intensidade volta a ser alvo na próxima 1ª passada
+    }
+  });
+
+  L.webGLHeatmap = function (options) {
+    return new L.WebGLHeatmap(options);
+  };
+})();